@@ -1,12 +1,34 @@
-from dataclasses import dataclass
+import csv
+import itertools
+import operator
+import os
+import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from urllib.parse import urljoin
 
+import requests
+from lxml import html
+from lxml.cssselect import CSSSelector
+from lxml.html import HtmlElement
+from requests.adapters import HTTPAdapter, Retry
+
 
 BASE_URL = "https://webscraper.io/"
 HOME_URL = urljoin(BASE_URL, "test-sites/e-commerce/more/")
 
+PAGE_URLS = {
+    "home": HOME_URL,
+    "computers": urljoin(HOME_URL, "computers"),
+    "laptops": urljoin(HOME_URL, "computers/laptops"),
+    "tablets": urljoin(HOME_URL, "computers/tablets"),
+    "phones": urljoin(HOME_URL, "phones"),
+    "touch": urljoin(HOME_URL, "phones/touch"),
+}
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Product:
     title: str
     description: str
@@ -15,8 +37,157 @@ class Product:
     num_of_reviews: int
 
 
+PRODUCT_FIELDS = [field.name for field in fields(Product)]
+get_product_row = operator.attrgetter(*PRODUCT_FIELDS)
+
+# (connect, read) seconds, so a stalled socket fails fast instead of hanging
+REQUEST_TIMEOUT = (5, 15)
+
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+)
+
+PRODUCT_CARD_SELECTOR = CSSSelector("div.thumbnail")
+TITLE_SELECTOR = CSSSelector("a.title")
+PRICE_SELECTOR = CSSSelector(".price")
+DESCRIPTION_SELECTOR = CSSSelector(".description")
+RATING_SELECTOR = CSSSelector(".ratings > p:last-of-type > span")
+REVIEW_COUNT_SELECTOR = CSSSelector(".review-count")
+LOAD_MORE_SELECTOR = CSSSelector(".ecomerce-items-scroll-more")
+
+PRICE_PATTERN = re.compile(r"\$?((?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?)")
+REVIEW_COUNT_PATTERN = re.compile(r"\d+")
+
+
+def parse_price(price_text: str) -> float:
+    price_match = PRICE_PATTERN.fullmatch(price_text.strip())
+
+    if not price_match:
+        raise ValueError(f"Unexpected price format: {price_text!r}")
+
+    return float(price_match.group(1).replace(",", ""))
+
+
+def parse_single_product(product_card: HtmlElement) -> Product:
+    review_count = REVIEW_COUNT_SELECTOR(product_card)
+    review_match = (
+        REVIEW_COUNT_PATTERN.search(review_count[0].text_content())
+        if review_count
+        else None
+    )
+
+    return Product(
+        title=TITLE_SELECTOR(product_card)[0].get("title"),
+        description=(
+            DESCRIPTION_SELECTOR(product_card)[0].text_content().strip()
+        ),
+        price=parse_price(PRICE_SELECTOR(product_card)[0].text_content()),
+        rating=len(RATING_SELECTOR(product_card)),
+        num_of_reviews=int(review_match.group()) if review_match else 0,
+    )
+
+
+def parse_products_on_page(page: HtmlElement) -> list[Product]:
+    return [
+        parse_single_product(product_card)
+        for product_card in PRODUCT_CARD_SELECTOR(page)
+    ]
+
+
+def create_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=HTTP_RETRY)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+def has_more_pages(page: HtmlElement) -> bool:
+    return bool(LOAD_MORE_SELECTOR(page))
+
+
+def get_page(
+    session: requests.Session, url: str, page_number: int = 1
+) -> HtmlElement:
+    params = {"page": page_number} if page_number > 1 else None
+    response = session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+
+    return html.fromstring(response.text)
+
+
+def get_category_pages(
+    session: requests.Session, url: str
+) -> Iterator[list[Product]]:
+    first_page = get_page(session, url)
+    first_products = parse_products_on_page(first_page)
+    yield first_products
+
+    if not has_more_pages(first_page):
+        return
+
+    # "Load more" fetches the same cards from ?page=N, so request those
+    # batches directly. A batch shorter than the first one is the last,
+    # which saves the extra request that would only come back empty.
+    # A batch repeating the previous one means the site ignored or
+    # clamped the page number, which would otherwise never end the loop.
+    page_size = len(first_products)
+    previous_products = first_products
+
+    for page_number in itertools.count(2):
+        page_products = parse_products_on_page(
+            get_page(session, url, page_number)
+        )
+
+        if not page_products or page_products == previous_products:
+            return
+
+        yield page_products
+
+        if len(page_products) < page_size:
+            return
+
+        previous_products = page_products
+
+
+def write_products_to_csv(
+    csv_path: str, product_pages: Iterable[list[Product]]
+) -> None:
+    # write next to the target and swap it in only once every page has
+    # been fetched, so a failed category never leaves a truncated CSV
+    partial_path = f"{csv_path}.part"
+
+    try:
+        with open(partial_path, "w", newline="", encoding="utf-8") as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(PRODUCT_FIELDS)
+
+            for products in product_pages:
+                writer.writerows(map(get_product_row, products))
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+    os.replace(partial_path, csv_path)
+
+
+def scrape_category(page_name: str, url: str) -> None:
+    # requests.Session is not thread-safe, so every category worker opens
+    # its own and closes it, with its pooled sockets, once the CSV is done
+    with create_session() as session:
+        write_products_to_csv(
+            f"{page_name}.csv", get_category_pages(session, url)
+        )
+
+
 def get_all_products() -> None:
-    pass
+    with ThreadPoolExecutor(max_workers=len(PAGE_URLS)) as executor:
+        # consume the results so a failed category raises here
+        list(executor.map(scrape_category, PAGE_URLS, PAGE_URLS.values()))
 
 
 if __name__ == "__main__":
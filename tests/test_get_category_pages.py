@@ -0,0 +1,90 @@
+import pytest
+from lxml import html
+
+from app import parse
+from app.parse import get_category_pages
+
+
+PRODUCT_CARD = """
+<div class="thumbnail">
+  <h4 class="price">$10.00</h4>
+  <a class="title" title="{title}">{title}</a>
+  <p class="description">Description</p>
+  <div class="ratings">
+    <p class="review-count">1 reviews</p>
+    <p><span></span></p>
+  </div>
+</div>
+"""
+LOAD_MORE_BUTTON = '<a class="ecomerce-items-scroll-more">More</a>'
+
+
+def make_page(page_number, num_of_products, has_load_more=False):
+    return html.fromstring(
+        "<div>"
+        + "".join(
+            PRODUCT_CARD.format(title=f"Product {page_number}.{index}")
+            for index in range(num_of_products)
+        )
+        + (LOAD_MORE_BUTTON if has_load_more else "")
+        + "</div>"
+    )
+
+
+@pytest.fixture
+def requested_pages(monkeypatch):
+    def stub_pages(*batch_sizes, has_load_more=True):
+        pages = [make_page(1, batch_sizes[0], has_load_more)] + [
+            make_page(page_number, batch_size)
+            for page_number, batch_size in enumerate(batch_sizes[1:], 2)
+        ]
+        requested = []
+
+        def get_page(session, url, page_number=1):
+            requested.append(page_number)
+            # like a server clamping out-of-range pages to the last one
+            return pages[min(page_number, len(pages)) - 1]
+
+        monkeypatch.setattr(parse, "get_page", get_page)
+        return requested
+
+    return stub_pages
+
+
+def get_batch_sizes(url="https://example.com/laptops"):
+    return [len(products) for products in get_category_pages(None, url)]
+
+
+def test_short_batch_ends_pagination(requested_pages):
+    requested = requested_pages(6, 6, 3, 0)
+
+    assert get_batch_sizes() == [6, 6, 3]
+    assert requested == [1, 2, 3]
+
+
+def test_empty_batch_ends_pagination_on_exact_multiple(requested_pages):
+    requested = requested_pages(6, 6, 0)
+
+    assert get_batch_sizes() == [6, 6]
+    assert requested == [1, 2, 3]
+
+
+def test_page_without_load_more_is_requested_once(requested_pages):
+    requested = requested_pages(3, 3, has_load_more=False)
+
+    assert get_batch_sizes() == [3]
+    assert requested == [1]
+
+
+def test_repeated_batch_ends_pagination(requested_pages):
+    requested = requested_pages(6, 6)
+
+    assert get_batch_sizes() == [6, 6]
+    assert requested == [1, 2, 3]
+
+
+def test_ignored_page_number_ends_pagination(requested_pages):
+    requested = requested_pages(6)
+
+    assert get_batch_sizes() == [6]
+    assert requested == [1, 2]
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+from lxml import html
+
+from app.parse import Product, parse_price, parse_products_on_page
+
+
+TEST_DIR = Path(__file__).resolve().parent
+
+
+@pytest.fixture(scope="module")
+def products():
+    page = html.fromstring((TEST_DIR / "product_cards.html").read_text())
+    return parse_products_on_page(page)
+
+
+def test_every_card_is_parsed(products):
+    assert len(products) == 2
+
+
+def test_product_with_reviews_is_parsed(products):
+    assert products[0] == Product(
+        title="Asus VivoBook X441NA-GA190",
+        description=(
+            "Asus VivoBook X441NA-GA190 Chocolate Black, 14\", "
+            "Celeron N3450, 4GB, 128GB SSD, Endless OS, ENG kbd"
+        ),
+        price=295.99,
+        rating=5,
+        num_of_reviews=1,
+    )
+
+
+def test_product_without_review_count_is_parsed(products):
+    assert products[1] == Product(
+        title="LG Optimus",
+        description="3.2\" screen",
+        price=57.99,
+        rating=3,
+        num_of_reviews=0,
+    )
+
+
+@pytest.mark.parametrize(
+    "price_text,price",
+    [
+        ("$295.99", 295.99),
+        ("$299", 299.0),
+        (" $1,099.99 ", 1099.99),
+        ("$1,234,567", 1234567.0),
+    ],
+)
+def test_price_is_parsed(price_text, price):
+    assert parse_price(price_text) == price
+
+
+@pytest.mark.parametrize(
+    "price_text",
+    ["", "$", "Call for price", "$1.2.3", "$1,,2", "$12,", "$1,2345.6"],
+)
+def test_unexpected_price_format_raises(price_text):
+    with pytest.raises(ValueError, match="Unexpected price format"):
+        parse_price(price_text)
+
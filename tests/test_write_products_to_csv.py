@@ -0,0 +1,61 @@
+import pytest
+import requests
+
+from app.parse import Product, write_products_to_csv
+
+
+PRODUCTS = [
+    Product(
+        title="Asus VivoBook X441NA-GA190",
+        description="Chocolate Black, 14\", Celeron N3450",
+        price=295.99,
+        rating=5,
+        num_of_reviews=1,
+    ),
+    Product(
+        title="LG Optimus",
+        description="3.2\" screen",
+        price=57.99,
+        rating=3,
+        num_of_reviews=0,
+    ),
+]
+
+
+def failing_pages():
+    yield PRODUCTS[:1]
+    raise requests.exceptions.RetryError("page 2 failed")
+
+
+def test_products_are_written_to_csv(tmp_path):
+    csv_path = tmp_path / "laptops.csv"
+
+    write_products_to_csv(str(csv_path), [PRODUCTS[:1], PRODUCTS[1:]])
+
+    assert csv_path.read_bytes() == (
+        b"title,description,price,rating,num_of_reviews\r\n"
+        b"Asus VivoBook X441NA-GA190,"
+        b"\"Chocolate Black, 14\"\", Celeron N3450\",295.99,5,1\r\n"
+        b"LG Optimus,\"3.2\"\" screen\",57.99,3,0\r\n"
+    )
+    assert list(tmp_path.iterdir()) == [csv_path]
+
+
+def test_failed_scrape_leaves_no_csv(tmp_path):
+    csv_path = tmp_path / "laptops.csv"
+
+    with pytest.raises(requests.exceptions.RetryError):
+        write_products_to_csv(str(csv_path), failing_pages())
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failed_scrape_keeps_previous_csv(tmp_path):
+    csv_path = tmp_path / "laptops.csv"
+    csv_path.write_text("previous run\n", encoding="utf-8")
+
+    with pytest.raises(requests.exceptions.RetryError):
+        write_products_to_csv(str(csv_path), failing_pages())
+
+    assert csv_path.read_text(encoding="utf-8") == "previous run\n"
+    assert list(tmp_path.iterdir()) == [csv_path]